@@ -2,6 +2,8 @@
 PGVector adapter for PostgreSQL-based vector operations.
 """
 from typing import Any, Dict, List, Optional, Tuple, Union
+import asyncio
+import copy
 import uuid
 import json
 import datetime
@@ -13,6 +15,9 @@ from pgvector.asyncpg import register_vector
 from memuri.domain.interfaces import VectorStoreAdapter, MemoryService
 from memuri.domain.models import Document, DocumentChunk, Memory, MemoryCategory, MemorySource, SearchQuery, SearchResult, ScoredMemory
 from memuri.core.config import VectorStoreSettings
+from memuri.core.logging import get_logger
+
+logger = get_logger(__name__)
 
 
 class PGVectorAdapter(VectorStoreAdapter):
@@ -194,10 +199,10 @@ class PGVectorAdapter(VectorStoreAdapter):
                     content, 
                     embedding, 
                     metadata, 
-                    1 - (embedding <=> $1) as similarity
+                    embedding <=> $1 as distance
                 FROM {self.table_name}
                 {filter_clause}
-                ORDER BY similarity DESC
+                ORDER BY distance
                 LIMIT $2
                 """,
                 *filter_params
@@ -212,7 +217,7 @@ class PGVectorAdapter(VectorStoreAdapter):
                 embedding=np.array(row['embedding']),
                 metadata=row['metadata'] or {},
             )
-            results.append((chunk, row['similarity']))
+            results.append((chunk, 1 - row['distance']))
             
         return results
             
@@ -234,6 +239,27 @@ class PGVectorAdapter(VectorStoreAdapter):
                 document_ids,
             ) 
 
+class _SharedPool:
+    """Connection pool holder shared by PgVectorStore instances.
+    
+    An asyncpg pool only works on the event loop that created it, so the
+    holder remembers that loop and starts over when used from another one
+    (e.g. a second asyncio.run call).
+    """
+    
+    def __init__(self):
+        self.pool: Optional[asyncpg.Pool] = None
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.lock: Optional[asyncio.Lock] = None
+        
+    def bind(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Drop a pool created on a different event loop."""
+        if self.loop is not loop:
+            self.loop = loop
+            self.pool = None
+            self.lock = asyncio.Lock()
+
+
 # New class implementing MemoryService interface for the factory pattern
 class PgVectorStore(MemoryService):
     """PostgreSQL with pgvector as a MemoryService."""
@@ -247,25 +273,90 @@ class PgVectorStore(MemoryService):
         self.connection_string = settings.connection_string
         self.collection_name = settings.collection_name or "memories"
         self.dimensions = settings.dimensions or 1536
-        self.pool: Optional[asyncpg.Pool] = None
+        self.min_pool_size = settings.min_pool_size
+        self.max_pool_size = settings.max_pool_size
+        self._shared = _SharedPool()
+        # Event loop this store's table was set up on; None until initialized
+        self._initialized_loop: Optional[asyncio.AbstractEventLoop] = None
+        # Serializes concurrent initialize() calls (e.g. warmup and a first search)
+        self._init_lock: Optional[asyncio.Lock] = None
+        self._init_lock_loop: Optional[asyncio.AbstractEventLoop] = None
+        
+    @property
+    def pool(self) -> Optional[asyncpg.Pool]:
+        """Connection pool, shared with stores created by use_collection."""
+        return self._shared.pool
+        
+    def use_collection(self, collection_name: str) -> "PgVectorStore":
+        """Get a store for another collection that reuses this connection pool.
+        
+        Args:
+            collection_name: Collection/table name for the new store
+            
+        Returns:
+            PgVectorStore: This store if the collection matches, otherwise a
+                new store sharing the pool; its table is created on first use
+        """
+        if collection_name == self.collection_name:
+            return self
+        
+        store = copy.copy(self)
+        store.collection_name = collection_name
+        store._initialized_loop = None
+        store._init_lock = None
+        store._init_lock_loop = None
+        return store
+        
+    def _is_ready(self, loop: asyncio.AbstractEventLoop) -> bool:
+        """Check the store was set up on loop and its shared pool is still open."""
+        return self._initialized_loop is loop and self._shared.pool is not None
+        
+    async def _ensure_initialized(self) -> None:
+        """Initialize the store unless it is ready on the running loop."""
+        if not self._is_ready(asyncio.get_running_loop()):
+            await self.initialize()
         
     async def initialize(self) -> None:
-        """Initialize connection pool and create tables if they don't exist."""
-        self.pool = await asyncpg.create_pool(
-            self.connection_string,
-            min_size=2,
-            max_size=10,
-            setup=self._setup_connection,
-        )
+        """Initialize connection pool and create tables if they don't exist.
         
-        # Create table if it doesn't exist
+        Safe to call concurrently: callers wait for a single initialization
+        instead of racing DDL statements, which Postgres can reject.
+        """
+        loop = asyncio.get_running_loop()
+        if self._init_lock_loop is not loop:
+            self._init_lock = asyncio.Lock()
+            self._init_lock_loop = loop
+        
+        async with self._init_lock:
+            if self._is_ready(loop):
+                return
+            await self._initialize_pool(loop)
+            await self._create_table()
+            self._initialized_loop = loop
+        
+    async def _initialize_pool(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Create the shared pool and the vector extension once per pool."""
+        self._shared.bind(loop)
+        async with self._shared.lock:
+            if self._shared.pool is not None:
+                return
+            pool = await asyncpg.create_pool(
+                self.connection_string,
+                min_size=self.min_pool_size,
+                max_size=self.max_pool_size,
+                setup=self._setup_connection,
+            )
+            async with pool.acquire() as conn:
+                # Create the vector extension if it doesn't exist
+                try:
+                    await conn.execute("CREATE EXTENSION IF NOT EXISTS vector;")
+                except Exception as e:
+                    logger.warning(f"Failed to create vector extension: {e}. Extension might already exist or requires admin privileges.")
+            self._shared.pool = pool
+        
+    async def _create_table(self) -> None:
+        """Create this store's table and indexes if they don't exist."""
         async with self.pool.acquire() as conn:
-            # First, create the vector extension if it doesn't exist
-            try:
-                await conn.execute("CREATE EXTENSION IF NOT EXISTS vector;")
-            except Exception as e:
-                logger.warning(f"Failed to create vector extension: {e}. Extension might already exist or requires admin privileges.")
-            
             await conn.execute(
                 f"""
                 CREATE TABLE IF NOT EXISTS {self.collection_name} (
@@ -283,6 +374,41 @@ class PgVectorStore(MemoryService):
                     ON {self.collection_name} USING ivfflat (embedding vector_cosine_ops);
                 """
             )
+        
+    async def close(self) -> None:
+        """Close the connection pool shared by this store and its siblings.
+        
+        Any of them can still be used afterwards; they open a new pool.
+        """
+        shared = self._shared
+        if shared.pool is not None and shared.loop is asyncio.get_running_loop():
+            await shared.pool.close()
+        shared.pool = None
+        shared.loop = None
+        self._initialized_loop = None
+        
+    async def warmup(self) -> None:
+        """Prepare the store so the first real search doesn't pay setup costs.
+        
+        Opens the connection pool and creates the table if needed, then runs
+        a throwaway nearest-neighbour query to plan the search statement and
+        page in the vector index.
+        """
+        await self._ensure_initialized()
+        
+        # Any non-zero vector works; cosine distance to a zero vector is undefined
+        probe = [1.0] * self.dimensions
+        async with self.pool.acquire() as conn:
+            await conn.fetchval("SELECT 1")
+            await conn.fetch(
+                f"""
+                SELECT id
+                FROM {self.collection_name}
+                ORDER BY embedding <=> $1
+                LIMIT 1
+                """,
+                probe,
+            )
             
     async def _setup_connection(self, conn: asyncpg.Connection) -> None:
         """Set up connection with vector extension."""
@@ -297,8 +423,7 @@ class PgVectorStore(MemoryService):
         Returns:
             Memory: Added memory with ID and any other fields populated
         """
-        if not self.pool:
-            await self.initialize()
+        await self._ensure_initialized()
             
         # Generate ID if not provided
         if not memory.id:
@@ -347,17 +472,63 @@ class PgVectorStore(MemoryService):
         Returns:
             List[Memory]: Added memories with IDs and any other fields populated
         """
-        if not self.pool:
-            await self.initialize()
+        await self._ensure_initialized()
             
+        if not memories:
+            return memories
+
         for memory in memories:
             if not memory.id:
                 memory.id = str(uuid.uuid4())
-                
-        # Add each memory one by one
-        for memory in memories:
-            await self.add(memory)
-            
+
+        # Insert in chunks with one multi-row statement per chunk, keeping
+        # well below PostgreSQL's 32767 bind parameter limit
+        columns_per_row = 7
+        rows_per_statement = 1000
+
+        async with self.pool.acquire() as conn:
+            async with conn.transaction():
+                for i in range(0, len(memories), rows_per_statement):
+                    chunk = memories[i:i + rows_per_statement]
+
+                    placeholders = []
+                    params: List[Any] = []
+                    for row_idx, memory in enumerate(chunk):
+                        base = row_idx * columns_per_row
+                        placeholders.append(
+                            "(" + ", ".join(f"${base + col}" for col in range(1, columns_per_row + 1)) + ")"
+                        )
+
+                        embedding = memory.embedding
+                        if isinstance(embedding, np.ndarray):
+                            embedding = embedding.tolist()
+
+                        params.extend([
+                            memory.id,
+                            memory.content,
+                            memory.category.value,
+                            memory.source.value,
+                            embedding,
+                            json.dumps(memory.metadata or {}),
+                            memory.created_at,
+                        ])
+
+                    await conn.execute(
+                        f"""
+                        INSERT INTO {self.collection_name}
+                            (id, content, category, source, embedding, metadata, created_at)
+                        VALUES {", ".join(placeholders)}
+                        ON CONFLICT (id)
+                        DO UPDATE SET
+                            content = EXCLUDED.content,
+                            category = EXCLUDED.category,
+                            source = EXCLUDED.source,
+                            embedding = EXCLUDED.embedding,
+                            metadata = EXCLUDED.metadata
+                        """,
+                        *params,
+                    )
+
         return memories
         
     async def get(self, memory_id: str) -> Optional[Memory]:
@@ -369,8 +540,7 @@ class PgVectorStore(MemoryService):
         Returns:
             Optional[Memory]: Memory if found, None otherwise
         """
-        if not self.pool:
-            await self.initialize()
+        await self._ensure_initialized()
             
         async with self.pool.acquire() as conn:
             row = await conn.fetchrow(
@@ -405,8 +575,7 @@ class PgVectorStore(MemoryService):
         Returns:
             Memory: Updated memory
         """
-        if not self.pool:
-            await self.initialize()
+        await self._ensure_initialized()
             
         # Add/update memory
         return await self.add(memory)
@@ -420,8 +589,7 @@ class PgVectorStore(MemoryService):
         Returns:
             bool: True if the memory was deleted, False otherwise
         """
-        if not self.pool:
-            await self.initialize()
+        await self._ensure_initialized()
             
         async with self.pool.acquire() as conn:
             result = await conn.execute(
@@ -444,13 +612,14 @@ class PgVectorStore(MemoryService):
         Returns:
             SearchResult: Search results
         """
-        if not self.pool:
-            await self.initialize()
+        await self._ensure_initialized()
             
-        # Get query embedding
-        embedding_service = await self._get_embedding_service()
-        embedding_response = await embedding_service.embed_texts([query.query])
-        query_embedding = embedding_response.embeddings[0]
+        # Get query embedding, reusing a precomputed vector when provided
+        query_embedding = query.query_vector
+        if query_embedding is None:
+            embedding_service = await self._get_embedding_service()
+            embedding_response = await embedding_service.embed_texts([query.query])
+            query_embedding = embedding_response.embeddings[0]
         
         # Search by vector
         scored_memories = await self.search_by_vector(
@@ -486,8 +655,7 @@ class PgVectorStore(MemoryService):
         Returns:
             List[ScoredMemory]: Scored memories
         """
-        if not self.pool:
-            await self.initialize()
+        await self._ensure_initialized()
             
         # Build WHERE clause for filtering
         filter_conditions = []
@@ -520,10 +688,10 @@ class PgVectorStore(MemoryService):
                     embedding, 
                     metadata,
                     created_at,
-                    1 - (embedding <=> $1) as similarity
+                    embedding <=> $1 as distance
                 FROM {self.collection_name}
                 {filter_clause}
-                ORDER BY similarity DESC
+                ORDER BY distance
                 LIMIT $2
                 """,
                 *filter_params
@@ -543,12 +711,87 @@ class PgVectorStore(MemoryService):
             )
             scored_memory = ScoredMemory(
                 memory=memory,
-                score=row['similarity'],
+                score=1 - row['distance'],
             )
             results.append(scored_memory)
             
         return results
-        
+
+    async def search_by_vectors(
+        self,
+        vectors: List[List[float]],
+        top_k: int = 5,
+    ) -> List[List[ScoredMemory]]:
+        """Search for several query vectors with a single SQL statement.
+
+        The query vectors are joined laterally against the collection so the
+        whole batch costs one round-trip instead of one per query.
+
+        Args:
+            vectors: Query vectors
+            top_k: Number of results to return per query
+
+        Returns:
+            List[List[ScoredMemory]]: Scored memories for each query, in order
+        """
+        if not vectors:
+            return []
+
+        await self._ensure_initialized()
+
+        # One (vector, index) row per query; $1 is the shared LIMIT
+        values = ", ".join(
+            f"(${i + 2}::vector, {i})" for i in range(len(vectors))
+        )
+        params: List[Any] = [top_k]
+        for vector in vectors:
+            params.append(vector.tolist() if isinstance(vector, np.ndarray) else vector)
+
+        async with self.pool.acquire() as conn:
+            rows = await conn.fetch(
+                f"""
+                SELECT
+                    q.idx,
+                    m.id,
+                    m.content,
+                    m.category,
+                    m.source,
+                    m.embedding,
+                    m.metadata,
+                    m.created_at,
+                    m.distance
+                FROM (VALUES {values}) AS q(vec, idx)
+                CROSS JOIN LATERAL (
+                    SELECT
+                        id, content, category, source, embedding, metadata, created_at,
+                        embedding <=> q.vec as distance
+                    FROM {self.collection_name}
+                    ORDER BY distance
+                    LIMIT $1
+                ) AS m
+                ORDER BY q.idx, m.distance
+                """,
+                *params
+            )
+
+        # Partition rows back into per-query result lists
+        results: List[List[ScoredMemory]] = [[] for _ in vectors]
+        for row in rows:
+            memory = Memory(
+                id=row['id'],
+                content=row['content'],
+                category=MemoryCategory(row['category']),
+                source=row['source'],
+                embedding=row['embedding'],
+                metadata=json.loads(row['metadata']),
+                created_at=row['created_at'],
+            )
+            results[row['idx']].append(
+                ScoredMemory(memory=memory, score=1 - row['distance'])
+            )
+
+        return results
+
     async def search_by_text(
         self, 
         text: str,
@@ -569,8 +812,7 @@ class PgVectorStore(MemoryService):
         Returns:
             List[ScoredMemory]: Scored memories
         """
-        if not self.pool:
-            await self.initialize()
+        await self._ensure_initialized()
             
         # Get embedding for text query
         embedding_service = await self._get_embedding_service()
@@ -599,8 +841,7 @@ class PgVectorStore(MemoryService):
         Returns:
             int: Number of matching memories
         """
-        if not self.pool:
-            await self.initialize()
+        await self._ensure_initialized()
             
         # Build WHERE clause for filtering
         filter_conditions = []
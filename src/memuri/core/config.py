@@ -1,5 +1,6 @@
 """Configuration management for the memuri SDK."""
 
+import functools
 import os
 from typing import Dict, List, Literal, Optional, Union, Any
 
@@ -74,6 +75,8 @@ class VectorStoreSettings(BaseSettings):
     index_type: str = Field("hnsw", description="Index type for vector store")
     connection_string: Optional[str] = Field(None, description="Connection string for the vector store")
     collection_name: Optional[str] = Field(None, description="Collection/table name for the vector store")
+    min_pool_size: int = Field(2, description="Minimum connections in the vector store pool")
+    max_pool_size: int = Field(10, description="Maximum connections in the vector store pool")
     
     # HNSW-specific settings
     ef_construction: int = Field(200, description="ef_construction parameter for HNSW index")
@@ -217,10 +220,14 @@ class MemuriSettings(BaseSettings):
     )
 
 
+@functools.lru_cache(maxsize=None)
 def get_settings() -> MemuriSettings:
     """Get the application settings.
     
     This function loads settings from environment variables and .env file.
+    The result is cached and shared, so treat it as read-only: use
+    ``model_copy(update=...)`` for per-instance changes, and call
+    ``get_settings.cache_clear()`` to pick up environment changes.
     
     Returns:
         MemuriSettings: The application settings
@@ -10,10 +10,20 @@ import re
 import unicodedata
 import logging
 import asyncio
+import functools
 from typing import Optional, List, Dict, Any, Callable, Awaitable, Tuple
 
+# Optional exact tokenizer; byte-length estimates are used without it
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
 logger = logging.getLogger(__name__)
 
+# Tokenizer used by the OpenAI text-embedding-3 models
+DEFAULT_ENCODING = "cl100k_base"
+
 # Common patterns to identify log lines and other problematic content
 LOG_PATTERN = re.compile(r'^\d{4}[-/]\d{2}[-/]\d{2}[ T]\d{2}:\d{2}:\d{2}[,.]\d{3}.*?INFO|DEBUG|ERROR|WARNING')
 REPEATED_FRAGMENT_PATTERN = re.compile(r'(.{15,}?)\1{2,}')  # Detect 3+ repetitions of 15+ char fragments
@@ -22,6 +32,23 @@ CONTROL_CHARS_PATTERN = re.compile(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]')
 URL_PATTERN = re.compile(r'https?://\S+')
 PROBLEMATIC_CHARS = re.compile(r'[\uFFFE\uFFFF\uFEFF\u0000-\u0008\u000B\u000C\u000E-\u001F\uD800-\uDFFF]')
 
+# Single-pass replacements for typographic punctuation and invisible characters
+# commonly found in pasted chat text
+CHAR_TRANSLATION_TABLE = str.maketrans({
+    '\u201c': '"', '\u201d': '"',  # Curly double quotes
+    '\u2018': "'", '\u2019': "'",  # Curly single quotes
+    '\u2013': '-', '\u2014': '--',  # En and em dashes
+    '\u2026': '...', '\u2022': '*',  # Ellipsis and bullet
+    '\u00a0': ' ',  # Non-breaking space
+    '\u200b': '',  # Zero-width space
+    '\u200c': '',  # Zero-width non-joiner
+    '\u200d': '',  # Zero-width joiner
+    '\u200e': '',  # Left-to-right mark
+    '\u200f': '',  # Right-to-left mark
+    '\u2028': ' ',  # Line separator
+    '\u2029': ' ',  # Paragraph separator
+})
+
 def is_valid_utf8(text: str) -> bool:
     """Check if a string can be encoded as valid UTF-8.
     
@@ -47,29 +74,20 @@ def remove_surrogate_chars(text: str) -> str:
         Text with surrogate characters removed
     """
     # Handle surrogate pairs and isolated surrogates
-    result = ""
-    for c in text:
-        if not (0xD800 <= ord(c) <= 0xDFFF):  # Skip surrogate range
-            result += c
-    return result
+    return ''.join(c for c in text if not (0xD800 <= ord(c) <= 0xDFFF))
 
-def clean_text(text: str, max_length: int = 8000, preserve_utf8: bool = True) -> str:
-    """
-    Clean and sanitize text for API compatibility and improved processing.
+def _normalize_unicode(text: str) -> str:
+    """Normalize non-ASCII text for API compatibility.
     
     Args:
-        text: The input text to clean
-        max_length: Maximum length to truncate to (default: 8000)
-        preserve_utf8: Whether to preserve valid UTF-8 characters (default: True)
+        text: Input text containing non-ASCII characters
         
     Returns:
-        Cleaned and sanitized text string
+        Text with typographic characters replaced and Unicode NFKD-normalized
     """
-    if not text:
-        return ""
-    
-    # Remove problematic characters
-    text = PROBLEMATIC_CHARS.sub('', text)
+    text = text.translate(CHAR_TRANSLATION_TABLE)
+    if text.isascii():
+        return text
     
     # Remove surrogate characters
     try:
@@ -77,16 +95,6 @@ def clean_text(text: str, max_length: int = 8000, preserve_utf8: bool = True) ->
     except Exception as e:
         logger.warning(f"Error removing surrogate characters: {e}")
     
-    # Remove control characters
-    text = CONTROL_CHARS_PATTERN.sub('', text)
-    
-    # Remove log lines that might be pasted accidentally
-    cleaned_lines = []
-    for line in text.split('\n'):
-        if not LOG_PATTERN.search(line):
-            cleaned_lines.append(line)
-    text = '\n'.join(cleaned_lines)
-    
     # Normalize Unicode (handling errors)
     try:
         text = unicodedata.normalize('NFKD', text)
@@ -115,21 +123,42 @@ def clean_text(text: str, max_length: int = 8000, preserve_utf8: bool = True) ->
             # Fallback: keep only ASCII
             text = ''.join(c for c in text if ord(c) < 128)
     
-    # Replace common Unicode quotes and other special characters
-    replacements = {
-        '"': '"', '"': '"',
-        ''': "'", ''': "'",
-        '–': '-', '—': '--', 
-        '…': '...', '•': '*',
-        '\u200b': '',  # Zero-width space
-        '\u200e': '',  # Left-to-right mark
-        '\u200f': '',  # Right-to-left mark
-        '\u2028': ' ', # Line separator
-        '\u2029': ' ', # Paragraph separator
-    }
-    
-    for char, replacement in replacements.items():
-        text = text.replace(char, replacement)
+    # NFKD can produce characters covered by the table (e.g. small em dash)
+    return text.translate(CHAR_TRANSLATION_TABLE)
+
+def clean_text(text: str, max_length: Optional[int] = 8000, preserve_utf8: bool = True) -> str:
+    """
+    Clean and sanitize text for API compatibility and improved processing.
+    
+    Args:
+        text: The input text to clean
+        max_length: Maximum length to truncate to (default: 8000); None
+            disables truncation
+        preserve_utf8: Whether to preserve valid UTF-8 characters (default: True)
+        
+    Returns:
+        Cleaned and sanitized text string
+    """
+    if not text:
+        return ""
+    
+    # Remove problematic characters
+    text = PROBLEMATIC_CHARS.sub('', text)
+    
+    # Remove control characters
+    text = CONTROL_CHARS_PATTERN.sub('', text)
+    
+    # Remove log lines that might be pasted accidentally
+    cleaned_lines = []
+    for line in text.split('\n'):
+        if not LOG_PATTERN.search(line):
+            cleaned_lines.append(line)
+    text = '\n'.join(cleaned_lines)
+    
+    # Non-ASCII text goes through the translation table first; only text that
+    # still contains non-ASCII characters afterwards pays for NFKD normalization
+    if not text.isascii():
+        text = _normalize_unicode(text)
     
     # Fix repeated fragments that might be from copy-paste errors
     def replace_repetition(match):
@@ -152,14 +181,29 @@ def clean_text(text: str, max_length: int = 8000, preserve_utf8: bool = True) ->
     text = re.sub(r' {3,}', ' ', text)     # Replace 3+ spaces with single space
     
     # Truncate if too long
-    if len(text) > max_length:
-        text = text[:max_length] + "... [text truncated due to length]"
+    if max_length is not None:
+        text = truncate_text(text, max_length)
     
     # Final strip of whitespace
     text = text.strip()
     
     return text
 
+def truncate_text(text: str, max_length: int) -> str:
+    """
+    Truncate text to max_length characters, marking that it was cut.
+    
+    Args:
+        text: Text to truncate
+        max_length: Maximum length to keep
+        
+    Returns:
+        The text, or its first max_length characters plus a truncation marker
+    """
+    if len(text) <= max_length:
+        return text
+    return text[:max_length] + "... [text truncated due to length]"
+
 def normalize_text_for_embedding(text: str) -> str:
     """
     Normalize text specifically for embedding models.
@@ -235,6 +279,109 @@ def batch_text(text: str, max_tokens_per_chunk: int = 1000) -> List[str]:
     
     return chunks
 
+@functools.lru_cache(maxsize=None)
+def _get_encoding(encoding_name: str):
+    """Load and cache a tiktoken encoding, or None if it is unavailable."""
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.get_encoding(encoding_name)
+    except Exception as e:
+        # Encodings are downloaded on first use; fall back to estimates offline
+        logger.warning(f"Could not load tiktoken encoding {encoding_name}: {e}")
+        return None
+
+def count_tokens(text: str, encoding_name: str = DEFAULT_ENCODING) -> int:
+    """
+    Count the tokens in text as the embedding model sees them.
+    
+    Uses tiktoken when its encoding is available. Otherwise estimates from the UTF-8 byte
+    length (~4 bytes per token), which unlike character length does not
+    undercount dense non-Latin text.
+    
+    Args:
+        text: Text to measure
+        encoding_name: tiktoken encoding name
+        
+    Returns:
+        Number of tokens (exact or estimated)
+    """
+    encoding = _get_encoding(encoding_name)
+    if encoding is not None:
+        return len(encoding.encode(text, disallowed_special=()))
+    return (len(text.encode('utf-8')) + 3) // 4
+
+def split_text_by_tokens(
+    text: str,
+    max_tokens: int,
+    overlap_tokens: int = 0,
+    encoding_name: str = DEFAULT_ENCODING,
+    max_chars: Optional[int] = None,
+) -> List[str]:
+    """
+    Split text into windows of at most max_tokens tokens.
+    
+    Consecutive windows share overlap_tokens tokens so content cut at a
+    boundary still appears whole in one chunk. Without a tiktoken encoding, windows
+    are measured in characters using the average characters per token
+    implied by count_tokens' byte-length estimate.
+    
+    Args:
+        text: Text to split
+        max_tokens: Maximum tokens per chunk
+        overlap_tokens: Tokens shared between consecutive chunks
+        encoding_name: tiktoken encoding name
+        max_chars: Optional character limit per chunk as well, e.g. so chunks
+            survive clean_text's default 8000 character cap uncut
+        
+    Returns:
+        List of text chunks
+    """
+    chunks = _split_by_tokens(text, max_tokens, overlap_tokens, encoding_name)
+    if max_chars is None:
+        return chunks
+    
+    result = []
+    for chunk in chunks:
+        if len(chunk) <= max_chars:
+            result.append(chunk)
+            continue
+        # Keep roughly the same overlap, measured in this chunk's characters
+        chars_per_token = len(chunk) / max(1, count_tokens(chunk, encoding_name))
+        overlap_chars = min(int(overlap_tokens * chars_per_token), max_chars // 2)
+        result.extend(_split_windows(chunk, max_chars, overlap_chars))
+    return result
+
+def _split_by_tokens(text: str, max_tokens: int, overlap_tokens: int, encoding_name: str) -> List[str]:
+    """Split text into overlapping token windows (see split_text_by_tokens)."""
+    encoding = _get_encoding(encoding_name)
+    if encoding is None:
+        total_tokens = count_tokens(text, encoding_name)
+        if total_tokens <= max_tokens:
+            return [text]
+        chars_per_token = len(text) / total_tokens
+        return _split_windows(
+            text,
+            max(1, int(max_tokens * chars_per_token)),
+            int(overlap_tokens * chars_per_token),
+        )
+    
+    tokens = encoding.encode(text, disallowed_special=())
+    if len(tokens) <= max_tokens:
+        return [text]
+    
+    return [encoding.decode(window) for window in _split_windows(tokens, max_tokens, overlap_tokens)]
+
+def _split_windows(seq, size: int, overlap: int) -> list:
+    """Split a sequence into windows of size items, overlapping by overlap items."""
+    step = max(1, size - overlap)
+    windows = []
+    for start in range(0, len(seq), step):
+        windows.append(seq[start:start + size])
+        if start + size >= len(seq):
+            break
+    return windows
+
 def extract_metadata(text: str) -> Dict[str, Any]:
     """
     Extract potential metadata from text.
@@ -309,7 +456,8 @@ async def safe_process_batched_text(
     text: str,
     processor: Callable[[str], Awaitable[Any]],
     max_tokens_per_batch: int = 1000,
-    combine_results: Callable[[List[Any]], Any] = lambda results: results
+    combine_results: Callable[[List[Any]], Any] = lambda results: results,
+    overlap_tokens: int = 0,
 ) -> Any:
     """
     Process long text in batches to avoid token limits.
@@ -319,15 +467,16 @@ async def safe_process_batched_text(
         processor: Async function to process each batch
         max_tokens_per_batch: Maximum tokens per batch
         combine_results: Function to combine batch results
+        overlap_tokens: Tokens shared between consecutive batches
         
     Returns:
         Combined result from processing batches
     """
-    # Clean the text
-    clean_content = clean_text(text)
+    # Clean the text without truncating it; splitting is what bounds the size
+    clean_content = clean_text(text, max_length=None)
     
-    # Split into batches
-    batches = batch_text(clean_content, max_tokens_per_batch)
+    # Split into batches on token boundaries
+    batches = split_text_by_tokens(clean_content, max_tokens_per_batch, overlap_tokens)
     
     # Process each batch concurrently
     batch_results = await asyncio.gather(
@@ -260,6 +260,10 @@ class SearchQuery(BaseModel):
         default_factory=dict,
         description="Filters to apply to metadata"
     )
+    query_vector: Optional[List[float]] = Field(
+        None,
+        description="Precomputed embedding of the query; skips re-embedding when set"
+    )
 
 
 class SearchResult(BaseModel):
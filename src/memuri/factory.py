@@ -1,7 +1,7 @@
 """Factory classes for dynamically loading providers."""
 
 import importlib
-from typing import Any, Dict, List, Optional, Type, TypeVar, Union, cast, Protocol, runtime_checkable
+from typing import Any, Dict, List, Optional, Tuple, Type, TypeVar, Union, cast, Protocol, runtime_checkable
 
 from memuri.core.config import EmbeddingSettings, LLMSettings, MemuriSettings, VectorStoreSettings, get_settings
 from memuri.core.logging import get_logger
@@ -54,6 +54,9 @@ class ProviderFactory:
     # The base class that all providers must implement
     base_class: Type[Any] = object
     
+    # Resolved provider classes keyed by (factory class, provider name)
+    _provider_class_cache: Dict[Tuple[type, str], Type[Any]] = {}
+    
     @classmethod
     def get_provider_class(cls, provider_name: str) -> Type[T]:
         """Get the provider class for the given provider name.
@@ -67,6 +70,11 @@ class ProviderFactory:
         Raises:
             ValueError: If the provider is not supported
         """
+        cache_key = (cls, provider_name)
+        cached = ProviderFactory._provider_class_cache.get(cache_key)
+        if cached is not None:
+            return cast(Type[T], cached)
+        
         if provider_name not in cls.provider_map:
             supported = ", ".join(cls.provider_map.keys())
             raise ValueError(f"Unsupported provider: {provider_name}. Supported: {supported}")
@@ -86,6 +94,7 @@ class ProviderFactory:
                     f"Provider {provider_name} does not implement {cls.base_class.__name__}"
                 )
             
+            ProviderFactory._provider_class_cache[cache_key] = provider_class
             return cast(Type[T], provider_class)
         except (ImportError, AttributeError) as e:
             logger.error(f"Failed to load provider {provider_name}: {e}")
@@ -126,23 +135,19 @@ class EmbedderFactory(ProviderFactory):
             
         # Apply any overrides from kwargs to settings
         if kwargs:
-            # Create a copy of the settings to avoid modifying the original
-            settings_dict = settings.dict()
-            
-            # Update with the provided kwargs
-            for key, value in kwargs.items():
-                if hasattr(settings, key):
-                    settings_dict[key] = value
+            # Only override fields the settings object knows about
+            updates = {key: value for key, value in kwargs.items() if hasattr(settings, key)}
                     
             # Handle nested model_kwargs differently - merge rather than replace
-            if "model_kwargs" in kwargs and settings.model_kwargs:
-                settings_dict["model_kwargs"] = {
+            if "model_kwargs" in updates and settings.model_kwargs:
+                updates["model_kwargs"] = {
                     **settings.model_kwargs,
-                    **kwargs["model_kwargs"]
+                    **(updates["model_kwargs"] or {})
                 }
                 
-            # Recreate settings with the updated values    
-            settings = EmbeddingSettings(**settings_dict)
+            # Shallow copy with the overrides applied; avoids dumping and
+            # re-validating every field just to change a few of them
+            settings = settings.model_copy(update=updates)
         
         # Use provider from settings if not provided
         if provider is None:
@@ -208,6 +213,10 @@ class VectorStoreFactory(ProviderFactory):
     
     base_class = MemoryService
     
+    # Stores that can switch collections (use_collection), keyed by the
+    # settings that determine their connection pool
+    _instances: Dict[Tuple[Any, ...], MemoryService] = {}
+    
     @classmethod
     def create(
         cls, 
@@ -216,6 +225,9 @@ class VectorStoreFactory(ProviderFactory):
     ) -> MemoryService:
         """Create a vector store instance.
         
+        Stores for the same database and pool settings share one connection
+        pool, so creating one per collection does not open a new pool each time.
+        
         Args:
             provider: Name of the provider, defaults to config
             settings: Vector store settings, defaults to global config
@@ -231,11 +243,34 @@ class VectorStoreFactory(ProviderFactory):
         if provider is None:
             provider = settings.provider
         
+        cache_key = (
+            provider,
+            settings.connection_string,
+            settings.dimensions,
+            settings.min_pool_size,
+            settings.max_pool_size,
+        )
+        shared = cls._instances.get(cache_key)
+        if shared is not None:
+            return shared.use_collection(settings.collection_name or "memories")
+        
         # Get the provider class
         provider_class = cls.get_provider_class(provider)
         
         # Create and return an instance
-        return provider_class(settings=settings)
+        instance = provider_class(settings=settings)
+        if hasattr(instance, "use_collection"):
+            cls._instances[cache_key] = instance
+        return instance
+    
+    @classmethod
+    def clear_instances(cls) -> None:
+        """Forget cached stores so later create() calls build new ones.
+        
+        This does not close their connection pools; await ``close()`` on the
+        stores first if they are no longer needed.
+        """
+        cls._instances.clear()
 
 
 class ClassifierFactory(ProviderFactory):
@@ -302,6 +337,7 @@ class GatingFactory:
                 skip_words: List of words/phrases to skip
                 keep_phrases: List of words/phrases to always keep
                 max_recent_embeddings: Maximum number of recent embeddings to keep
+                quantize_recent_embeddings: Screen recent embeddings in int8
             
         Returns:
             MemoryGate: An initialized memory gate service
@@ -94,8 +94,8 @@ class Memuri:
         Returns:
             Memuri: A configured Memuri instance
         """
-        # Initialize with default settings
-        settings = get_settings()
+        # Overrides for this instance; the shared settings are never mutated
+        updates: Dict[str, Any] = {}
         
         # Process embedder configuration
         embedding_service = None
@@ -133,7 +133,7 @@ class Memuri:
             )
             
             # Update settings
-            settings.embedding = embedding_settings
+            updates["embedding"] = embedding_settings
         
         # Process LLM configuration if provided
         llm_service = None
@@ -153,7 +153,7 @@ class Memuri:
             )
             
             # Update settings
-            settings.llm = llm_settings
+            updates["llm"] = llm_settings
             
             # Create LLM service directly (could also use a factory pattern as with embeddings)
             llm_service = LlmFactory.create(provider=provider, settings=llm_settings)
@@ -166,9 +166,12 @@ class Memuri:
             
             # Create vector store settings and service through factory
             vector_settings = VectorStoreSettings(**vector_config)
-            settings.vector_store = vector_settings
+            updates["vector_store"] = vector_settings
             memory_service = VectorStoreFactory.create(provider=provider, settings=vector_settings)
         
+        # Copy the cached global settings with this instance's overrides
+        settings = get_settings().model_copy(update=updates)
+        
         # Create Memuri instance with configured services
         return Memuri(
             settings=settings,
@@ -1,10 +1,16 @@
 """Keyword-based classifier for memories."""
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set
 
 from memuri.core.categories import CATEGORY_SUBCATEGORY_MAP, get_parent_category
 from memuri.domain.models import MemoryCategory
 
+# Optional Aho-Corasick automaton for matching all keywords in one pass
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 
 class KeywordClassifier:
     """Simple keyword-based classifier for memory categorization."""
@@ -102,6 +108,40 @@ class KeywordClassifier:
             MemoryCategory.MISCELLANEOUS: ["misc", "other", "general", "various", "assorted", "diverse"],
             MemoryCategory.MISC: ["misc", "other", "general", "various", "assorted", "diverse"],
         }
+        
+        self._build_matcher()
+    
+    def _build_matcher(self) -> None:
+        """Index the keywords for matching.
+        
+        Call again after modifying ``category_keywords``.
+        """
+        # Each distinct lowercase keyword maps to every category listing it
+        self._keyword_categories: Dict[str, List[MemoryCategory]] = {}
+        for category, keywords in self.category_keywords.items():
+            for keyword in keywords:
+                self._keyword_categories.setdefault(keyword.lower(), []).append(category)
+        
+        self._automaton = None
+        if ahocorasick is not None:
+            automaton = ahocorasick.Automaton()
+            for keyword in self._keyword_categories:
+                automaton.add_word(keyword, keyword)
+            automaton.make_automaton()
+            self._automaton = automaton
+    
+    def _match_keywords(self, text: str) -> Set[str]:
+        """Find the keywords that occur in text.
+        
+        Args:
+            text: Lowercased text to scan
+            
+        Returns:
+            Set[str]: Matched keywords
+        """
+        if self._automaton is not None:
+            return {keyword for _, keyword in self._automaton.iter(text)}
+        return {keyword for keyword in self._keyword_categories if keyword in text}
     
     async def classify(self, text: str) -> Dict[MemoryCategory, float]:
         """Classify text into memory categories.
@@ -124,10 +164,9 @@ class KeywordClassifier:
         scores[MemoryCategory.MISCELLANEOUS] = 0.1
         
         # Count keyword occurrences for each category
-        for category, keywords in self.category_keywords.items():
-            for keyword in keywords:
-                if keyword.lower() in text:
-                    scores[category] += 0.15  # Increase score for each keyword found
+        for keyword in self._match_keywords(text):
+            for category in self._keyword_categories[keyword]:
+                scores[category] += 0.15  # Increase score for each keyword found
         
         # Boost parent category scores based on subcategory scores
         for subcategory, score in scores.items():
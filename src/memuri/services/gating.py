@@ -31,6 +31,8 @@ class MemoryGate:
         skip_words: Optional[List[str]] = None,
         keep_phrases: Optional[List[str]] = None,
         max_recent_embeddings: int = 100,
+        quantize_recent_embeddings: bool = False,
+        quantization_margin: float = 0.02,
     ):
         """Initialize the memory gate.
         
@@ -45,6 +47,10 @@ class MemoryGate:
             skip_words: List of words/phrases that signal content should be skipped
             keep_phrases: List of words/phrases that signal content should be kept
             max_recent_embeddings: Maximum number of recent embeddings to keep in memory
+            quantize_recent_embeddings: Screen recent embeddings with an int8 copy
+                and only rescore near-threshold candidates in float32
+            quantization_margin: How far below the similarity threshold an int8
+                score must be for the float32 rescoring to be skipped
         """
         self.embedding_service = embedding_service
         self.memory_service = memory_service
@@ -55,21 +61,72 @@ class MemoryGate:
         self.similarity_threshold = similarity_threshold
         self.confidence_threshold = confidence_threshold
         self.min_content_length = min_content_length
+        # Setters precompute the lowercased forms used by the rule checks
         self.skip_words = skip_words or ["ok", "thanks", "thank you", "sure", "alright", "got it"]
         self.keep_phrases = keep_phrases or ["remember", "note", "don't forget", "important"]
         
-        # In-memory cache of recent embeddings for quick similarity checks
-        self.recent_embeddings: List[List[float]] = []
+        # In-memory ring buffer of recent embeddings for quick similarity checks.
+        # Rows are float32 and allocated on the first embedding, once the
+        # dimension is known; norms are cached so a check is a single GEMV.
         self.max_recent_embeddings = max_recent_embeddings
+        self._recent: Optional[np.ndarray] = None
+        self._recent_norms: Optional[np.ndarray] = None
+        self._recent_count = 0
+        self._recent_next = 0
+        
+        # Optional int8 copy (one scale per row) used to screen candidates;
+        # built from the float rows when first needed, so the option can be
+        # switched on at any time
+        self.quantize_recent_embeddings = quantize_recent_embeddings
+        self.quantization_margin = quantization_margin
+        self._recent_i8: Optional[np.ndarray] = None
+        self._recent_scales: Optional[np.ndarray] = None
         
         logger.info("Initialized memory gate")
     
-    async def evaluate(self, text: str, metadata: Optional[Dict[str, Any]] = None) -> Tuple[bool, str]:
+    @property
+    def skip_words(self) -> List[str]:
+        """Words/phrases that cause an exact-match message to be skipped."""
+        return self._skip_words
+    
+    @skip_words.setter
+    def skip_words(self, words: List[str]) -> None:
+        self._skip_words = list(words)
+        self._skip_words_lower = frozenset(word.lower() for word in self._skip_words)
+    
+    @property
+    def keep_phrases(self) -> List[str]:
+        """Words/phrases that cause a message containing them to be kept."""
+        return self._keep_phrases
+    
+    @keep_phrases.setter
+    def keep_phrases(self, phrases: List[str]) -> None:
+        self._keep_phrases = list(phrases)
+        self._keep_phrases_lower = tuple(phrase.lower() for phrase in self._keep_phrases)
+    
+    @property
+    def recent_embeddings(self) -> List[List[float]]:
+        """Read-only copy of the recent embeddings, oldest first."""
+        if self._recent is None:
+            return []
+        if self._recent_count < self.max_recent_embeddings:
+            rows = self._recent[:self._recent_count]
+        else:
+            rows = np.roll(self._recent, -self._recent_next, axis=0)
+        return rows.tolist()
+    
+    async def evaluate(
+        self,
+        text: str,
+        metadata: Optional[Dict[str, Any]] = None,
+        embedding: Optional[List[float]] = None,
+    ) -> Tuple[bool, str]:
         """Evaluate whether text should be stored in memory.
         
         Args:
             text: Text to evaluate
             metadata: Optional metadata that might inform the decision
+            embedding: Optional precomputed embedding of the text
             
         Returns:
             Tuple[bool, str]: Decision (True=keep, False=skip) and reason
@@ -83,8 +140,8 @@ class MemoryGate:
             return True, "Contains explicit keep phrase"
         
         # Check similarity to recent memories (if memory service available)
-        if self.recent_embeddings:
-            similar, similarity = await self._check_similarity(text)
+        if self._recent_count:
+            similar, similarity = await self._check_similarity(text, embedding)
             if similar:
                 return False, f"Similar to recent memory (score: {similarity:.2f})"
         
@@ -104,6 +161,7 @@ class MemoryGate:
         metadata: Optional[Dict[str, Any]] = None,
         category: Optional[MemoryCategory] = None,
         source: MemorySource = MemorySource.USER,
+        embedding: Optional[List[float]] = None,
     ) -> Tuple[bool, str, Optional[Memory]]:
         """Evaluate whether text should be stored and store it if it passes.
         
@@ -112,6 +170,7 @@ class MemoryGate:
             metadata: Optional metadata
             category: Optional memory category
             source: Source of the memory
+            embedding: Optional precomputed embedding of the text
             
         Returns:
             Tuple[bool, str, Optional[Memory]]: 
@@ -124,8 +183,50 @@ class MemoryGate:
             logger.warning("No memory service available for storage")
             return False, "No memory service available", None
         
+        should_store, reason, memory = await self.evaluate_and_prepare(
+            text=text,
+            metadata=metadata,
+            category=category,
+            source=source,
+            embedding=embedding,
+        )
+        
+        if not should_store:
+            return False, reason, None
+        
+        # Store the memory
+        stored_memory = await self.memory_service.add(memory)
+        
+        return True, reason, stored_memory
+    
+    async def evaluate_and_prepare(
+        self,
+        text: str,
+        metadata: Optional[Dict[str, Any]] = None,
+        category: Optional[MemoryCategory] = None,
+        source: MemorySource = MemorySource.USER,
+        embedding: Optional[List[float]] = None,
+    ) -> Tuple[bool, str, Optional[Memory]]:
+        """Evaluate text and build the memory to store without persisting it.
+        
+        This lets callers collect several accepted memories and write them
+        with a single batch insert.
+        
+        Args:
+            text: Text to evaluate
+            metadata: Optional metadata
+            category: Optional memory category
+            source: Source of the memory
+            embedding: Optional precomputed embedding of the text
+            
+        Returns:
+            Tuple[bool, str, Optional[Memory]]:
+                Decision (True=keep, False=skip),
+                Reason for the decision,
+                Memory object ready to store if kept, None otherwise
+        """
         # Evaluate if should store
-        should_store, reason = await self.evaluate(text, metadata)
+        should_store, reason = await self.evaluate(text, metadata, embedding)
         
         if not should_store:
             return False, reason, None
@@ -137,9 +238,10 @@ class MemoryGate:
         # Default category if still not determined
         category = category or MemoryCategory.GENERAL
         
-        # Create embedding
-        embedding_response = await self.embedding_service.embed_texts([text])
-        embedding = embedding_response.embeddings[0]
+        # Create embedding unless one was supplied
+        if embedding is None:
+            embedding_response = await self.embedding_service.embed_texts([text])
+            embedding = embedding_response.embeddings[0]
         
         # Add to recent embeddings cache
         self._add_to_recent_embeddings(embedding)
@@ -153,10 +255,7 @@ class MemoryGate:
             metadata=metadata or {},
         )
         
-        # Store the memory
-        stored_memory = await self.memory_service.add(memory)
-        
-        return True, reason, stored_memory
+        return True, reason, memory
     
     def _passes_basic_rules(self, text: str) -> bool:
         """Apply basic rule-based heuristics.
@@ -174,10 +273,9 @@ class MemoryGate:
             
         # Check for skip words/phrases (exact matches)
         text_lower = text.lower()
-        for word in self.skip_words:
-            if word.lower() == text_lower:
-                logger.debug(f"Text matches skip word: {word}")
-                return False
+        if text_lower in self._skip_words_lower:
+            logger.debug(f"Text matches skip word: {text_lower}")
+            return False
                 
         return True
     
@@ -191,41 +289,127 @@ class MemoryGate:
             bool: True if contains keep phrases, False otherwise
         """
         text_lower = text.lower()
-        for phrase in self.keep_phrases:
-            if phrase.lower() in text_lower:
+        for phrase in self._keep_phrases_lower:
+            if phrase in text_lower:
                 logger.debug(f"Text contains keep phrase: {phrase}")
                 return True
                 
         return False
     
-    async def _check_similarity(self, text: str) -> Tuple[bool, float]:
+    async def _check_similarity(
+        self, text: str, embedding: Optional[List[float]] = None
+    ) -> Tuple[bool, float]:
         """Check if text is similar to recent memories.
         
         Args:
             text: Text to check
+            embedding: Optional precomputed embedding of the text
             
         Returns:
             Tuple[bool, float]: (is_similar, similarity_score)
         """
-        if not self.recent_embeddings:
+        if not self._recent_count:
             return False, 0.0
             
         # Get embedding for text
-        embedding_response = await self.embedding_service.embed_texts([text])
-        query_embedding = embedding_response.embeddings[0]
-        
-        # Calculate similarity with recent embeddings
-        max_similarity = 0.0
-        for existing_embedding in self.recent_embeddings:
-            similarity = self._cosine_similarity(query_embedding, existing_embedding)
-            max_similarity = max(max_similarity, similarity)
-            
-            if similarity > self.similarity_threshold:
-                logger.debug(f"Text similar to recent memory: {similarity:.4f}")
-                return True, similarity
+        query_embedding = embedding
+        if query_embedding is None:
+            embedding_response = await self.embedding_service.embed_texts([text])
+            query_embedding = embedding_response.embeddings[0]
+        
+        # Calculate similarity with all recent embeddings at once
+        max_similarity = self._max_recent_similarity(query_embedding)
+        
+        if max_similarity > self.similarity_threshold:
+            logger.debug(f"Text similar to recent memory: {max_similarity:.4f}")
+            return True, max_similarity
                 
         return False, max_similarity
     
+    def _max_recent_similarity(self, embedding: List[float]) -> float:
+        """Compute the highest cosine similarity against recent embeddings.
+        
+        Args:
+            embedding: Embedding to compare
+            
+        Returns:
+            float: Maximum cosine similarity, 0.0 if nothing comparable is cached
+        """
+        vector = np.asarray(embedding, dtype=np.float32)
+        if self._recent is None or vector.shape[0] != self._recent.shape[1]:
+            return 0.0
+        
+        norm = np.linalg.norm(vector)
+        if norm == 0:
+            return 0.0
+        
+        n = self._recent_count
+        norms = self._recent_norms[:n]
+        
+        if self.quantize_recent_embeddings:
+            self._ensure_quantized_buffer()
+            return self._max_quantized_similarity(vector, norm)
+        
+        # Avoid division by zero for zero vectors in the buffer
+        with np.errstate(divide="ignore", invalid="ignore"):
+            similarities = (self._recent[:n] @ vector) / (norms * norm)
+        similarities = np.where(norms > 0, similarities, 0.0)
+        
+        return float(similarities.max())
+    
+    def _max_quantized_similarity(self, vector: np.ndarray, norm: float) -> float:
+        """Approximate the maximum similarity with int8 rows, refining near the threshold.
+        
+        Args:
+            vector: Query embedding as float32
+            norm: Norm of the query embedding
+            
+        Returns:
+            float: Maximum cosine similarity
+        """
+        n = self._recent_count
+        norms = self._recent_norms[:n]
+        quantized, scale = self._quantize(vector)
+        
+        # int32 accumulation; int16 would overflow for typical dimensions
+        dots = self._recent_i8[:n].astype(np.int32) @ quantized.astype(np.int32)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            approx = dots * (self._recent_scales[:n] * scale) / (norms * norm)
+        approx = np.where(norms > 0, approx, 0.0)
+        
+        # Rescore only rows that could be at or above the threshold
+        candidates = np.flatnonzero(approx >= self.similarity_threshold - self.quantization_margin)
+        if candidates.size == 0:
+            return float(approx.max())
+        
+        exact = (self._recent[candidates] @ vector) / (norms[candidates] * norm)
+        return float(exact.max())
+    
+    def _ensure_quantized_buffer(self) -> None:
+        """Build the int8 copy of the recent embeddings if it is missing."""
+        if self._recent_i8 is not None:
+            return
+        
+        self._recent_i8 = np.zeros(self._recent.shape, dtype=np.int8)
+        self._recent_scales = np.zeros(self._recent.shape[0], dtype=np.float32)
+        for i in range(self._recent_count):
+            self._recent_i8[i], self._recent_scales[i] = self._quantize(self._recent[i])
+    
+    @staticmethod
+    def _quantize(vector: np.ndarray) -> Tuple[np.ndarray, float]:
+        """Symmetrically quantize a vector to int8.
+        
+        Args:
+            vector: Vector to quantize
+            
+        Returns:
+            Tuple[np.ndarray, float]: (int8 values, scale)
+        """
+        scale = float(np.abs(vector).max()) / 127.0
+        if scale == 0:
+            return np.zeros(vector.shape, dtype=np.int8), 0.0
+        return np.round(vector / scale).astype(np.int8), scale
+    
     async def _classify_relevance(self, text: str) -> Tuple[bool, MemoryCategory, float]:
         """Classify text relevance.
         
@@ -262,32 +446,31 @@ class MemoryGate:
         Args:
             embedding: Embedding to add
         """
-        self.recent_embeddings.append(embedding)
+        if self.max_recent_embeddings <= 0:
+            return
         
-        # Trim if needed
-        if len(self.recent_embeddings) > self.max_recent_embeddings:
-            self.recent_embeddings.pop(0)  # Remove oldest
-    
-    @staticmethod
-    def _cosine_similarity(a: List[float], b: List[float]) -> float:
-        """Calculate cosine similarity between two vectors.
-        
-        Args:
-            a: First vector
-            b: Second vector
-            
-        Returns:
-            float: Cosine similarity
-        """
-        a_array = np.array(a)
-        b_array = np.array(b)
+        vector = np.asarray(embedding, dtype=np.float32)
         
-        dot_product = np.dot(a_array, b_array)
-        norm_a = np.linalg.norm(a_array)
-        norm_b = np.linalg.norm(b_array)
+        # (Re)allocate the buffer on first use or if the dimension changed
+        if self._recent is None or vector.shape[0] != self._recent.shape[1]:
+            self._recent = np.zeros((self.max_recent_embeddings, vector.shape[0]), dtype=np.float32)
+            self._recent_norms = np.zeros(self.max_recent_embeddings, dtype=np.float32)
+            self._recent_count = 0
+            self._recent_next = 0
+            self._recent_i8 = None
+            self._recent_scales = None
         
-        # Avoid division by zero
-        if norm_a == 0 or norm_b == 0:
-            return 0.0
-            
-        return dot_product / (norm_a * norm_b) 
\ No newline at end of file
+        # Overwrite the oldest slot once the buffer is full
+        self._recent[self._recent_next] = vector
+        self._recent_norms[self._recent_next] = np.linalg.norm(vector)
+        if self.quantize_recent_embeddings:
+            self._ensure_quantized_buffer()
+            quantized, scale = self._quantize(vector)
+            self._recent_i8[self._recent_next] = quantized
+            self._recent_scales[self._recent_next] = scale
+        else:
+            # The int8 copy would miss this row; rebuild it if re-enabled
+            self._recent_i8 = None
+            self._recent_scales = None
+        self._recent_next = (self._recent_next + 1) % self.max_recent_embeddings
+        self._recent_count = min(self._recent_count + 1, self.max_recent_embeddings)
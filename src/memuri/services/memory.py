@@ -21,6 +21,7 @@ from memuri.domain.models import (
     SearchResult,
 )
 from memuri.services.gating import MemoryGate
+from memuri.services.search_batcher import BatchedSearcher
 
 logger = get_logger(__name__)
 
@@ -41,6 +42,7 @@ class MemoryOrchestrator:
         feedback_service: FeedbackService,
         memory_gate: Optional[MemoryGate] = None,
         settings: Optional[MemuriSettings] = None,
+        search_batcher: Optional[BatchedSearcher] = None,
     ):
         """Initialize the memory orchestrator.
         
@@ -52,6 +54,7 @@ class MemoryOrchestrator:
             feedback_service: Feedback service
             memory_gate: Optional memory gating service
             settings: Optional settings
+            search_batcher: Optional batcher that coalesces concurrent searches
         """
         self.memory_service = memory_service
         self.embedding_service = embedding_service
@@ -59,6 +62,7 @@ class MemoryOrchestrator:
         self.classifier_service = classifier_service
         self.feedback_service = feedback_service
         self.settings = settings
+        self.search_batcher = search_batcher
         
         # Initialize memory gate if not provided
         self.memory_gate = memory_gate or MemoryGate(
@@ -78,6 +82,7 @@ class MemoryOrchestrator:
         source: MemorySource = MemorySource.USER,
         metadata: Optional[Dict[str, Any]] = None,
         skip_gating: bool = False,
+        embedding: Optional[List[float]] = None,
     ) -> Tuple[bool, str, Optional[Memory]]:
         """Add a memory to the store with gating.
         
@@ -87,6 +92,7 @@ class MemoryOrchestrator:
             source: Memory source
             metadata: Memory metadata
             skip_gating: Whether to skip the gating process
+            embedding: Precomputed embedding of the content, if already available
             
         Returns:
             Tuple[bool, str, Optional[Memory]]:
@@ -101,6 +107,7 @@ class MemoryOrchestrator:
                 metadata=metadata,
                 category=category,
                 source=source,
+                embedding=embedding,
             )
             
             if not stored:
@@ -109,8 +116,10 @@ class MemoryOrchestrator:
                 
             return stored, reason, memory
             
-        # Skip gating logic - embed and store directly
-        embedding_response = await self.embedding_service.embed_texts([content])
+        # Skip gating logic - embed (unless already embedded) and store directly
+        if embedding is None:
+            embedding_response = await self.embedding_service.embed_texts([content])
+            embedding = embedding_response.embeddings[0]
         
         # Classify if no category provided
         if category is None:
@@ -122,13 +131,90 @@ class MemoryOrchestrator:
             content=content,
             category=category,
             source=source,
-            embedding=embedding_response.embeddings[0],
+            embedding=embedding,
             metadata=metadata or {},
         )
         
         stored_memory = await self.memory_service.add(memory)
         return True, "Gating skipped", stored_memory
-        
+
+    @track_latency()
+    async def add_memories_batch(
+        self,
+        items: List[Dict[str, Any]],
+        skip_gating: bool = False,
+    ) -> List[Tuple[bool, str, Optional[Memory]]]:
+        """Add several memories with one embedding call and one insert.
+
+        Each item holds the keyword arguments accepted by ``add_memory``:
+        ``content`` plus optional ``category``, ``source``, ``metadata`` and a
+        precomputed ``embedding``. Items without an embedding are embedded
+        together in a single request, and all memories that pass gating are
+        written with a single ``add_batch`` call.
+
+        Args:
+            items: Memories to add
+            skip_gating: Whether to skip the gating process
+
+        Returns:
+            List[Tuple[bool, str, Optional[Memory]]]: One result per item, in
+                the same shape and order as ``add_memory`` would return
+        """
+        if not items:
+            return []
+
+        # Embed everything that still lacks a vector in one round-trip,
+        # sending repeated contents only once
+        embeddings: List[Optional[List[float]]] = [item.get("embedding") for item in items]
+        missing = [i for i, embedding in enumerate(embeddings) if embedding is None]
+        if missing:
+            unique_contents = list(dict.fromkeys(items[i]["content"] for i in missing))
+            embedding_response = await self.embedding_service.embed_texts(unique_contents)
+            by_content = dict(zip(unique_contents, embedding_response.embeddings))
+            for i in missing:
+                embeddings[i] = by_content[items[i]["content"]]
+
+        results: List[Tuple[bool, str, Optional[Memory]]] = []
+        to_store: List[Memory] = []
+        for item, embedding in zip(items, embeddings):
+            content = item["content"]
+            category = item.get("category")
+            source = item.get("source", MemorySource.USER)
+            metadata = item.get("metadata")
+
+            if skip_gating:
+                if category is None:
+                    scores = await self.classifier_service.classify(content)
+                    category = max(scores.items(), key=lambda x: x[1])[0]
+                memory = Memory(
+                    content=content,
+                    category=category,
+                    source=source,
+                    embedding=embedding,
+                    metadata=metadata or {},
+                )
+                results.append((True, "Gating skipped", memory))
+                to_store.append(memory)
+                continue
+
+            stored, reason, memory = await self.memory_gate.evaluate_and_prepare(
+                text=content,
+                metadata=metadata,
+                category=category,
+                source=source,
+                embedding=embedding,
+            )
+            if not stored:
+                logger.info(f"Memory gating prevented storage: {reason}")
+            else:
+                to_store.append(memory)
+            results.append((stored, reason, memory))
+
+        if to_store:
+            await self.memory_service.add_batch(to_store)
+
+        return results
+
     @track_latency()
     async def get_memory(self, memory_id: str) -> Optional[Memory]:
         """Get a memory by ID.
@@ -142,16 +228,28 @@ class MemoryOrchestrator:
         return await self.memory_service.get(memory_id)
         
     @track_latency()
-    async def search_memory(self, query: SearchQuery) -> SearchResult:
+    async def search_memory(
+        self,
+        query: SearchQuery,
+        embedding: Optional[List[float]] = None,
+    ) -> SearchResult:
         """Search for memories.
         
         Args:
             query: Search query
+            embedding: Precomputed embedding of the query text, used when the
+                query has no ``query_vector`` of its own
             
         Returns:
             SearchResult: Search results
         """
-        search_result = await self.memory_service.search(query)
+        if embedding is not None and query.query_vector is None:
+            query = query.model_copy(update={"query_vector": embedding})
+        
+        if self.search_batcher:
+            search_result = await self.search_batcher.search(query)
+        else:
+            search_result = await self.memory_service.search(query)
         
         # Rerank if requested and available
         if query.rerank and search_result.memories and self.reranking_service:
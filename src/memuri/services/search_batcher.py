@@ -0,0 +1,140 @@
+"""Coalescing of concurrent memory searches into batched vector queries."""
+
+import asyncio
+import time
+from typing import List, Optional, Set, Tuple
+
+from memuri.core.logging import get_logger
+from memuri.domain.interfaces import EmbeddingService, MemoryService
+from memuri.domain.models import SearchQuery, SearchResult
+
+logger = get_logger(__name__)
+
+
+class BatchedSearcher:
+    """Batches searches that arrive within a short window into one query.
+
+    Concurrent sessions sharing a memory service each issue their own vector
+    search. This collects the searches submitted within ``window`` seconds,
+    embeds the ones without a precomputed vector in a single call and runs
+    them all through the memory service's ``search_by_vectors``.
+
+    Queries with category or metadata filters, and memory services without
+    ``search_by_vectors``, fall back to a regular ``search`` call.
+    """
+
+    def __init__(
+        self,
+        memory_service: MemoryService,
+        embedding_service: EmbeddingService,
+        window: float = 0.005,
+        max_batch_size: int = 64,
+    ):
+        """Initialize the batched searcher.
+
+        Args:
+            memory_service: Memory service to search
+            embedding_service: Embedding service for queries without a vector
+            window: Seconds to wait for more queries before flushing a batch
+            max_batch_size: Flush immediately once this many queries are pending
+        """
+        self.memory_service = memory_service
+        self.embedding_service = embedding_service
+        self.window = window
+        self.max_batch_size = max_batch_size
+
+        self._pending: List[Tuple[SearchQuery, asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._flush_tasks: Set[asyncio.Task] = set()
+
+    def _can_batch(self, query: SearchQuery) -> bool:
+        """Check whether a query can be merged into a batch.
+
+        Args:
+            query: Search query
+
+        Returns:
+            bool: True if the query has no filters and the store supports batching
+        """
+        if query.category is not None or query.metadata_filters:
+            return False
+        return hasattr(self.memory_service, "search_by_vectors")
+
+    async def search(self, query: SearchQuery) -> SearchResult:
+        """Submit a query and wait for its share of the batch results.
+
+        Args:
+            query: Search query
+
+        Returns:
+            SearchResult: Search results for this query
+        """
+        if not self._can_batch(query):
+            return await self.memory_service.search(query)
+
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future = loop.create_future()
+        self._pending.append((query, future))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._schedule_flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.window, self._schedule_flush)
+
+        return await future
+
+    def _schedule_flush(self) -> None:
+        """Hand the pending queries to a flush task."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.ensure_future(self._flush(batch))
+            self._flush_tasks.add(task)
+            task.add_done_callback(self._flush_tasks.discard)
+
+    async def _flush(self, batch: List[Tuple[SearchQuery, asyncio.Future]]) -> None:
+        """Run one batched search and resolve each query's future.
+
+        Args:
+            batch: Pending queries with their futures
+        """
+        start = time.perf_counter()
+        queries = [query for query, _ in batch]
+
+        try:
+            # Embed every query that lacks a precomputed vector in one call
+            vectors = [query.query_vector for query in queries]
+            missing = [i for i, vector in enumerate(vectors) if vector is None]
+            if missing:
+                embedding_response = await self.embedding_service.embed_texts(
+                    [queries[i].query for i in missing]
+                )
+                for i, vector in zip(missing, embedding_response.embeddings):
+                    vectors[i] = vector
+
+            top_k = max(query.top_k for query in queries)
+            batch_results = await self.memory_service.search_by_vectors(vectors, top_k=top_k)
+        except Exception as e:
+            logger.error(f"Batched search failed: {e}")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        search_time = time.perf_counter() - start
+        for (query, future), memories in zip(batch, batch_results):
+            if future.done():
+                continue
+            memories = memories[:query.top_k]
+            future.set_result(
+                SearchResult(
+                    memories=memories,
+                    query=query.query,
+                    total_found=len(memories),
+                    search_time=search_time,
+                    reranked=False,
+                )
+            )
@@ -0,0 +1,150 @@
+"""Tests for the memory gate's in-memory similarity checks (no external services)."""
+
+import numpy as np
+import pytest
+
+from memuri.domain.models import EmbeddingResponse
+from memuri.services.gating import MemoryGate
+
+
+class StaticEmbeddingService:
+    """Embedding service returning fixed vectors for known texts."""
+
+    def __init__(self, vectors):
+        self.vectors = vectors
+
+    async def embed_texts(self, texts):
+        embeddings = [self.vectors[text] for text in texts]
+        return EmbeddingResponse(
+            embeddings=embeddings,
+            model="static",
+            dimensions=len(embeddings[0]) if embeddings else 0,
+            tokens=0,
+        )
+
+    async def embed_documents(self, documents):
+        return await self.embed_texts([doc.content for doc in documents])
+
+    async def get_dimensions(self):
+        return 3
+
+
+def make_gate(max_recent_embeddings=3, **kwargs):
+    embedding_service = StaticEmbeddingService({
+        "a": [1.0, 0.0, 0.0],
+        "near a": [0.99, 0.1, 0.0],
+        "b": [0.0, 1.0, 0.0],
+    })
+    return MemoryGate(
+        embedding_service=embedding_service,
+        similarity_threshold=0.9,
+        max_recent_embeddings=max_recent_embeddings,
+        **kwargs,
+    )
+
+
+@pytest.mark.asyncio
+async def test_similarity_detects_near_duplicate():
+    gate = make_gate()
+    gate._add_to_recent_embeddings([1.0, 0.0, 0.0])
+
+    similar, score = await gate._check_similarity("near a")
+    assert similar
+    assert score == pytest.approx(0.995, abs=1e-3)
+
+    similar, score = await gate._check_similarity("b")
+    assert not similar
+    assert score == pytest.approx(0.0, abs=1e-6)
+
+
+@pytest.mark.asyncio
+async def test_similarity_uses_precomputed_embedding():
+    gate = make_gate()
+    gate._add_to_recent_embeddings([0.0, 1.0, 0.0])
+
+    # "a" would not match, but the supplied embedding does
+    similar, _ = await gate._check_similarity("a", embedding=[0.0, 1.0, 0.0])
+    assert similar
+
+
+@pytest.mark.asyncio
+async def test_recent_buffer_evicts_oldest():
+    gate = make_gate(max_recent_embeddings=2)
+    gate._add_to_recent_embeddings([1.0, 0.0, 0.0])
+    gate._add_to_recent_embeddings([0.0, 1.0, 0.0])
+    gate._add_to_recent_embeddings([0.0, 0.0, 1.0])
+
+    assert gate._recent_count == 2
+    similar, _ = await gate._check_similarity("a")
+    assert not similar
+
+
+def test_recent_embeddings_are_listed_oldest_first():
+    gate = make_gate(max_recent_embeddings=3)
+    assert gate.recent_embeddings == []
+
+    gate._add_to_recent_embeddings([1.0, 0.0, 0.0])
+    gate._add_to_recent_embeddings([0.0, 1.0, 0.0])
+    assert gate.recent_embeddings == [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0]]
+
+    gate._add_to_recent_embeddings([0.0, 0.0, 1.0])
+    gate._add_to_recent_embeddings([1.0, 1.0, 0.0])
+    assert gate.recent_embeddings == [[0.0, 1.0, 0.0], [0.0, 0.0, 1.0], [1.0, 1.0, 0.0]]
+
+
+@pytest.mark.asyncio
+async def test_zero_vectors_are_never_similar():
+    gate = make_gate()
+    gate._add_to_recent_embeddings([0.0, 0.0, 0.0])
+
+    assert gate._max_recent_similarity(np.array([1.0, 0.0, 0.0])) == 0.0
+
+
+@pytest.mark.asyncio
+async def test_quantized_similarity_matches_float32():
+    rng = np.random.default_rng(0)
+    recent = rng.standard_normal((20, 64)).astype(np.float32)
+    query = recent[7] + 0.05 * rng.standard_normal(64).astype(np.float32)
+
+    exact_gate = make_gate(max_recent_embeddings=20)
+    quantized_gate = make_gate(max_recent_embeddings=20, quantize_recent_embeddings=True)
+    for row in recent:
+        exact_gate._add_to_recent_embeddings(row)
+        quantized_gate._add_to_recent_embeddings(row)
+
+    exact = exact_gate._max_recent_similarity(query)
+    assert exact > 0.9
+    assert quantized_gate._max_recent_similarity(query) == pytest.approx(exact, abs=1e-5)
+
+    # Far from every row: the int8 estimate is used directly
+    far = -np.abs(rng.standard_normal(64)).astype(np.float32)
+    assert quantized_gate._max_recent_similarity(far) == pytest.approx(
+        exact_gate._max_recent_similarity(far), abs=0.02
+    )
+
+
+def test_rule_checks_follow_updated_word_lists():
+    gate = make_gate()
+    gate.min_content_length = 0
+    gate.skip_words = ["Got It"]
+    gate.keep_phrases = ["Deadline"]
+
+    assert not gate._passes_basic_rules("got it")
+    assert gate._passes_basic_rules("got it, thanks")
+    assert gate._has_keep_phrases("The DEADLINE moved")
+    assert not gate._has_keep_phrases("Remember this")
+
+
+def test_quantization_can_be_enabled_after_embeddings_are_cached():
+    gate = make_gate(max_recent_embeddings=4)
+    gate._add_to_recent_embeddings([1.0, 0.0, 0.0])
+    gate._add_to_recent_embeddings([0.0, 1.0, 0.0])
+
+    gate.quantize_recent_embeddings = True
+    assert gate._max_recent_similarity(np.array([0.99, 0.1, 0.0])) == pytest.approx(0.995, abs=1e-3)
+
+    # Rows added while quantization is off are picked up when it is switched back on
+    gate.quantize_recent_embeddings = False
+    gate._add_to_recent_embeddings([0.0, 0.0, 1.0])
+    gate.quantize_recent_embeddings = True
+    assert gate._max_recent_similarity(np.array([0.0, 0.1, 0.99])) == pytest.approx(0.995, abs=1e-3)
@@ -0,0 +1,79 @@
+"""Tests that KeywordClassifier's keyword matching keeps the nested-loop scores."""
+
+from typing import Dict
+
+import pytest
+
+from memuri.core.categories import get_parent_category
+from memuri.domain.models import MemoryCategory
+from memuri.services.classifier import keyword as keyword_module
+from memuri.services.classifier.keyword import KeywordClassifier
+
+TEXTS = [
+    "",
+    "Nothing to see here",
+    # "schedule" is listed under four categories, "project" and "job" under three
+    "My SCHEDULE for the project: a job interview every morning",
+    # Overlapping keywords: "personal goal" also contains "personal"
+    "A personal goal of mine is self-improvement through daily exercise",
+    # Repeats count once per keyword
+    "work work work, then more work",
+    "I like reading books and articles about travel; my favorite trip was a music festival",
+]
+
+
+def nested_loop_classify(classifier: KeywordClassifier, text: str) -> Dict[MemoryCategory, float]:
+    """Score text the way classify() did before the keyword index existed."""
+    text = text.lower()
+    scores: Dict[MemoryCategory, float] = {category: 0.0 for category in MemoryCategory}
+    scores[MemoryCategory.MISCELLANEOUS] = 0.1
+
+    for category, keywords in classifier.category_keywords.items():
+        for keyword in keywords:
+            if keyword.lower() in text:
+                scores[category] += 0.15
+
+    for subcategory, score in scores.items():
+        if score > 0:
+            parent_category_str = get_parent_category(subcategory.value)
+            if parent_category_str != subcategory.value:
+                try:
+                    scores[MemoryCategory(parent_category_str)] += score * 0.5
+                except ValueError:
+                    pass
+
+    total = sum(scores.values())
+    return {category: score / total for category, score in scores.items()}
+
+
+@pytest.fixture(params=["automaton", "substring"])
+def classifier(request, monkeypatch):
+    """A KeywordClassifier using either the Aho-Corasick or the substring matcher."""
+    if request.param == "automaton":
+        pytest.importorskip("ahocorasick")
+    else:
+        monkeypatch.setattr(keyword_module, "ahocorasick", None)
+    classifier = KeywordClassifier()
+    assert (classifier._automaton is not None) == (request.param == "automaton")
+    return classifier
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("text", TEXTS)
+async def test_scores_match_nested_loop(classifier, text):
+    scores = await classifier.classify(text)
+
+    assert scores == pytest.approx(nested_loop_classify(classifier, text))
+
+
+@pytest.mark.asyncio
+async def test_rebuilt_matcher_counts_shared_and_mixed_case_keywords(classifier):
+    classifier.category_keywords[MemoryCategory.PREFERENCES].append("Espresso")
+    classifier.category_keywords[MemoryCategory.DIETARY_PREFERENCES].append("espresso")
+    classifier._build_matcher()
+    text = "An espresso before my schedule starts"
+
+    scores = await classifier.classify(text)
+
+    assert scores == pytest.approx(nested_loop_classify(classifier, text))
+    assert scores[MemoryCategory.DIETARY_PREFERENCES] > 0
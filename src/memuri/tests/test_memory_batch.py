@@ -0,0 +1,124 @@
+"""Tests for MemoryOrchestrator.add_memories_batch using in-memory fakes."""
+
+import pytest
+
+from memuri.domain.models import Memory, MemoryCategory, MemorySource
+from memuri.services.memory import MemoryOrchestrator
+
+
+class FakeMemoryService:
+    def __init__(self):
+        self.batches = []
+
+    async def add_batch(self, memories):
+        self.batches.append(list(memories))
+        return memories
+
+
+class FakeClassifier:
+    async def classify(self, text):
+        return {MemoryCategory.PREFERENCES: 0.8, MemoryCategory.GENERAL: 0.2}
+
+
+class FakeGate:
+    """Rejects texts starting with "skip", otherwise builds the memory."""
+
+    def __init__(self):
+        self.seen = []
+
+    async def evaluate_and_prepare(self, text, metadata=None, category=None, source=MemorySource.USER, embedding=None):
+        self.seen.append((text, embedding))
+        if text.startswith("skip"):
+            return False, "rejected", None
+        memory = Memory(
+            content=text,
+            category=category or MemoryCategory.GENERAL,
+            source=source,
+            embedding=embedding,
+            metadata=metadata or {},
+        )
+        return True, "accepted", memory
+
+
+def make_orchestrator(embedding_service):
+    return MemoryOrchestrator(
+        memory_service=FakeMemoryService(),
+        embedding_service=embedding_service,
+        reranking_service=None,
+        classifier_service=FakeClassifier(),
+        feedback_service=None,
+        memory_gate=FakeGate(),
+    )
+
+
+@pytest.mark.asyncio
+async def test_batch_gates_each_item_and_stores_once(fake_embedding_service):
+    orchestrator = make_orchestrator(fake_embedding_service)
+
+    results = await orchestrator.add_memories_batch([
+        {"content": "keep one"},
+        {"content": "skip me"},
+        {"content": "keep two", "embedding": [42.0], "source": MemorySource.SYSTEM},
+    ])
+
+    assert [(stored, reason) for stored, reason, _ in results] == [
+        (True, "accepted"),
+        (False, "rejected"),
+        (True, "accepted"),
+    ]
+    assert results[1][2] is None
+    assert results[2][2].source == MemorySource.SYSTEM
+
+    # Only items without a vector are embedded, in one call; supplied vectors pass through
+    assert orchestrator.embedding_service.calls == [["keep one", "skip me"]]
+    assert orchestrator.memory_gate.seen == [
+        ("keep one", [8.0]),
+        ("skip me", [7.0]),
+        ("keep two", [42.0]),
+    ]
+
+    batches = orchestrator.memory_service.batches
+    assert len(batches) == 1
+    assert [memory.content for memory in batches[0]] == ["keep one", "keep two"]
+
+
+@pytest.mark.asyncio
+async def test_batch_embeds_repeated_content_once(fake_embedding_service):
+    orchestrator = make_orchestrator(fake_embedding_service)
+
+    results = await orchestrator.add_memories_batch([
+        {"content": "same"},
+        {"content": "other"},
+        {"content": "same"},
+    ], skip_gating=True)
+
+    assert orchestrator.embedding_service.calls == [["same", "other"]]
+    assert [memory.embedding for _, _, memory in results] == [[4.0], [5.0], [4.0]]
+
+
+@pytest.mark.asyncio
+async def test_batch_without_gating_classifies_missing_categories(fake_embedding_service):
+    orchestrator = make_orchestrator(fake_embedding_service)
+
+    results = await orchestrator.add_memories_batch([
+        {"content": "skip is not special here"},
+        {"content": "fixed", "category": MemoryCategory.TODO, "metadata": {"ts": 1}},
+    ], skip_gating=True)
+
+    assert [reason for _, reason, _ in results] == ["Gating skipped", "Gating skipped"]
+    assert results[0][2].category == MemoryCategory.PREFERENCES
+    assert results[1][2].category == MemoryCategory.TODO
+    assert results[1][2].metadata == {"ts": 1}
+    assert orchestrator.memory_gate.seen == []
+    assert len(orchestrator.memory_service.batches[0]) == 2
+
+
+@pytest.mark.asyncio
+async def test_batch_with_nothing_accepted_skips_insert(fake_embedding_service):
+    orchestrator = make_orchestrator(fake_embedding_service)
+
+    assert await orchestrator.add_memories_batch([]) == []
+    await orchestrator.add_memories_batch([{"content": "skip", "embedding": [1.0]}])
+
+    assert orchestrator.embedding_service.calls == []
+    assert orchestrator.memory_service.batches == []
@@ -42,9 +42,10 @@ async def create_real_memory_gate():
     
     if not memory_service:
         # Use the actual pgvector database from settings
-        vector_settings = get_settings().vector_store
         # Use a consistent collection name across test runs
-        vector_settings.collection_name = TEST_COLLECTION
+        vector_settings = get_settings().vector_store.model_copy(
+            update={"collection_name": TEST_COLLECTION}
+        )
         
         # Create actual memory service with real PGVector
         memory_service = VectorStoreFactory.create(
@@ -0,0 +1,93 @@
+"""Tests for PgVectorStore's SQL construction using a fake connection pool."""
+
+import datetime
+import json
+
+import pytest
+
+from memuri.domain.models import Memory, MemoryCategory, MemorySource
+
+
+def make_row(idx, memory_id, distance):
+    return {
+        "idx": idx,
+        "id": memory_id,
+        "content": f"content {memory_id}",
+        "category": "GENERAL",
+        "source": "user",
+        "embedding": [0.0, 1.0],
+        "metadata": json.dumps({"n": memory_id}),
+        "created_at": datetime.datetime(2024, 1, 1),
+        "distance": distance,
+    }
+
+
+@pytest.mark.asyncio
+async def test_search_by_vectors_single_statement_and_partitioning(fake_connection, make_pgvector_store):
+    fake_connection.rows = [
+        make_row(0, "a", 0.1),
+        make_row(0, "b", 0.3),
+        make_row(2, "c", 0.25),
+    ]
+    store = make_pgvector_store()
+
+    results = await store.search_by_vectors([[1.0, 0.0], [0.0, 1.0], [0.5, 0.5]], top_k=2)
+
+    assert len(fake_connection.calls) == 1
+    query, args = fake_connection.calls[0]
+    assert "($2::vector, 0), ($3::vector, 1), ($4::vector, 2)" in query
+    assert "ORDER BY distance" in query
+    assert args == (2, [1.0, 0.0], [0.0, 1.0], [0.5, 0.5])
+
+    assert [[m.memory.id for m in group] for group in results] == [["a", "b"], [], ["c"]]
+    assert results[0][0].score == pytest.approx(0.9)
+    assert results[2][0].memory.metadata == {"n": "c"}
+
+
+@pytest.mark.asyncio
+async def test_search_by_vectors_empty_input_skips_query(fake_connection, make_pgvector_store):
+    store = make_pgvector_store()
+
+    assert await store.search_by_vectors([]) == []
+    assert fake_connection.calls == []
+
+
+@pytest.mark.asyncio
+async def test_add_batch_numbers_placeholders_per_row(fake_connection, make_pgvector_store):
+    store = make_pgvector_store()
+    created_at = datetime.datetime(2024, 1, 1)
+    memories = [
+        Memory(id="m1", content="one", embedding=[1.0, 0.0], created_at=created_at),
+        Memory(
+            content="two",
+            category=MemoryCategory.TODO,
+            source=MemorySource.SYSTEM,
+            embedding=[0.0, 1.0],
+            metadata={"ts": 5},
+            created_at=created_at,
+        ),
+    ]
+
+    stored = await store.add_batch(memories)
+
+    assert len(fake_connection.calls) == 1
+    query, args = fake_connection.calls[0]
+    assert "($1, $2, $3, $4, $5, $6, $7), ($8, $9, $10, $11, $12, $13, $14)" in query
+    assert "ON CONFLICT (id)" in query
+    assert stored[1].id  # missing IDs are generated
+    assert args == (
+        "m1", "one", "GENERAL", "user", [1.0, 0.0], "{}", created_at,
+        stored[1].id, "two", "TODO", "system", [0.0, 1.0], '{"ts": 5}', created_at,
+    )
+
+
+@pytest.mark.asyncio
+async def test_add_batch_splits_into_statements_of_1000_rows(fake_connection, make_pgvector_store):
+    store = make_pgvector_store()
+    memories = [Memory(content=str(i), embedding=[0.0, 1.0]) for i in range(1001)]
+
+    await store.add_batch(memories)
+
+    assert [len(args) for _, args in fake_connection.calls] == [7000, 7]
+    # Numbering restarts in each statement
+    assert "VALUES ($1, $2, $3, $4, $5, $6, $7)" in fake_connection.calls[1][0]
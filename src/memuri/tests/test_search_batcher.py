@@ -0,0 +1,130 @@
+"""Tests for BatchedSearcher using in-memory fakes (no external services)."""
+
+import asyncio
+
+import pytest
+
+from memuri.domain.models import (
+    Memory,
+    MemoryCategory,
+    ScoredMemory,
+    SearchQuery,
+    SearchResult,
+)
+from memuri.services.search_batcher import BatchedSearcher
+
+
+class FakeMemoryService:
+    """Returns top_k memories per vector and records every call."""
+
+    def __init__(self, error=None):
+        self.error = error
+        self.batches = []
+        self.searches = []
+
+    async def search_by_vectors(self, vectors, top_k=5):
+        self.batches.append((list(vectors), top_k))
+        if self.error:
+            raise self.error
+        return [
+            [
+                ScoredMemory(memory=Memory(content=f"{vector[0]}-{rank}"), score=1.0 - rank / 10)
+                for rank in range(top_k)
+            ]
+            for vector in vectors
+        ]
+
+    async def search(self, query):
+        self.searches.append(query)
+        return SearchResult(memories=[], query=query.query, total_found=0, search_time=0.0)
+
+
+def make_searcher(embedding_service, memory_service=None, **kwargs):
+    return BatchedSearcher(
+        memory_service=memory_service or FakeMemoryService(),
+        embedding_service=embedding_service,
+        **kwargs,
+    )
+
+
+@pytest.mark.asyncio
+async def test_concurrent_queries_share_one_batch(fake_embedding_service):
+    searcher = make_searcher(fake_embedding_service, window=0.01)
+
+    results = await asyncio.gather(
+        searcher.search(SearchQuery(query="ab", top_k=1)),
+        searcher.search(SearchQuery(query="abcd", top_k=3)),
+        searcher.search(SearchQuery(query="ignored", query_vector=[9.0], top_k=2)),
+    )
+
+    memory_service = searcher.memory_service
+    assert len(memory_service.batches) == 1
+    vectors, top_k = memory_service.batches[0]
+    assert vectors == [[2.0], [4.0], [9.0]]
+    assert top_k == 3
+    # Only queries without a precomputed vector are embedded, in one call
+    assert fake_embedding_service.calls == [["ab", "abcd"]]
+
+    # Each query gets its own results, cut to its own top_k
+    assert [m.memory.content for m in results[0].memories] == ["2.0-0"]
+    assert [m.memory.content for m in results[1].memories] == ["4.0-0", "4.0-1", "4.0-2"]
+    assert [m.memory.content for m in results[2].memories] == ["9.0-0", "9.0-1"]
+    assert results[1].total_found == 3
+    assert results[1].query == "abcd"
+
+
+@pytest.mark.asyncio
+async def test_full_batch_flushes_without_waiting_for_window(fake_embedding_service):
+    searcher = make_searcher(fake_embedding_service, window=60, max_batch_size=2)
+
+    results = await asyncio.wait_for(
+        asyncio.gather(
+            searcher.search(SearchQuery(query="a", top_k=1)),
+            searcher.search(SearchQuery(query="bb", top_k=1)),
+        ),
+        timeout=1,
+    )
+
+    assert len(results) == 2
+    assert len(searcher.memory_service.batches) == 1
+    assert searcher._flush_handle is None
+
+
+@pytest.mark.asyncio
+async def test_filtered_queries_use_regular_search(fake_embedding_service):
+    searcher = make_searcher(fake_embedding_service)
+
+    category_query = SearchQuery(query="a", category=MemoryCategory.PREFERENCES)
+    metadata_query = SearchQuery(query="b", metadata_filters={"user": "1"})
+    await searcher.search(category_query)
+    await searcher.search(metadata_query)
+
+    assert searcher.memory_service.searches == [category_query, metadata_query]
+    assert searcher.memory_service.batches == []
+    assert fake_embedding_service.calls == []
+
+
+@pytest.mark.asyncio
+async def test_stores_without_batch_support_use_regular_search(fake_embedding_service):
+    class PlainMemoryService:
+        async def search(self, query):
+            return SearchResult(memories=[], query=query.query, total_found=0, search_time=0.0)
+
+    searcher = make_searcher(fake_embedding_service, memory_service=PlainMemoryService())
+
+    result = await searcher.search(SearchQuery(query="a"))
+    assert result.query == "a"
+
+
+@pytest.mark.asyncio
+async def test_batch_failure_reaches_every_waiter(fake_embedding_service):
+    error = RuntimeError("database unavailable")
+    searcher = make_searcher(fake_embedding_service, memory_service=FakeMemoryService(error=error), window=0.01)
+
+    results = await asyncio.gather(
+        searcher.search(SearchQuery(query="a")),
+        searcher.search(SearchQuery(query="bb")),
+        return_exceptions=True,
+    )
+
+    assert results == [error, error]
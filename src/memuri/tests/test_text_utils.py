@@ -0,0 +1,90 @@
+"""Tests for token counting and token-window splitting in text_utils."""
+
+import random
+import unicodedata
+
+import pytest
+
+from memuri.core import text_utils
+from memuri.core.config import EmbeddingSettings
+from memuri.core.text_utils import _split_windows, clean_text, count_tokens, split_text_by_tokens
+from memuri.services.embedding import OpenAIEmbeddingService
+
+
+@pytest.fixture
+def no_encoding(monkeypatch):
+    """Force the byte-length estimate even when tiktoken is installed."""
+    monkeypatch.setattr(text_utils, "_get_encoding", lambda encoding_name: None)
+
+
+def test_split_windows_overlap_and_boundaries():
+    seq = list(range(10))
+
+    assert _split_windows(seq, 4, 1) == [[0, 1, 2, 3], [3, 4, 5, 6], [6, 7, 8, 9]]
+    # A window ending exactly at the end of the sequence is the last one
+    assert _split_windows(seq, 5, 0) == [[0, 1, 2, 3, 4], [5, 6, 7, 8, 9]]
+    assert _split_windows(seq, 20, 5) == [seq]
+    # Overlap >= size still advances by one item
+    assert _split_windows([1, 2, 3], 2, 2) == [[1, 2], [2, 3]]
+
+
+def test_count_tokens_estimates_from_utf8_bytes(no_encoding):
+    assert count_tokens("") == 0
+    assert count_tokens("abcd") == 1
+    assert count_tokens("abcde") == 2
+    # Three bytes per character in UTF-8, so dense text isn't undercounted
+    assert count_tokens("日本語の") == 3
+
+
+def test_split_text_by_tokens_fallback(no_encoding):
+    assert split_text_by_tokens("short text", 10, 2) == ["short text"]
+
+    text = "word " * 400  # 2000 bytes -> 500 estimated tokens
+    chunks = split_text_by_tokens(text, 100, 10)
+
+    assert all(len(chunk) <= 400 for chunk in chunks)
+    assert "".join(chunk[40:] if i else chunk for i, chunk in enumerate(chunks)) == text
+    for previous, current in zip(chunks, chunks[1:]):
+        assert previous[-40:] == current[:40]
+
+
+def test_clean_text_without_cap_keeps_accented_text_whole():
+    text = " ".join(f"Le café numéro {i} est très bon en décembre." for i in range(40))
+
+    cleaned = clean_text(text, max_length=None)
+
+    # NFKD decomposition makes the cleaned text longer than the input
+    assert len(cleaned) > len(text)
+    assert "[text truncated due to length]" not in cleaned
+    assert cleaned.endswith(unicodedata.normalize("NFKD", "numéro 39 est très bon en décembre."))
+
+
+def test_split_text_by_tokens_respects_max_chars(no_encoding):
+    text = "x" * 1000
+
+    # 250 estimated tokens fit one token window, but not the character cap
+    chunks = split_text_by_tokens(text, 1000, 10, max_chars=300)
+
+    assert len(chunks) == 4
+    assert all(len(chunk) <= 300 for chunk in chunks)
+    # The 10-token overlap becomes 40 characters at ~4 characters per token
+    assert "".join(chunk[40:] if i else chunk for i, chunk in enumerate(chunks)) == text
+
+
+def test_long_text_chunks_are_embedded_without_truncation(no_encoding):
+    rng = random.Random(0)
+    words = ["alpha", "river", "stone", "cloud", "night", "green", "paper", "seven"]
+    text = "\n".join(
+        " ".join(f"{rng.choice(words)}{rng.randint(0, 999)}" for _ in range(10))
+        for _ in range(300)
+    )
+    cleaned = clean_text(text, max_length=None)
+
+    # The sizes the chat CLI uses for long input
+    chunks = split_text_by_tokens(cleaned, 6000, 256, max_chars=8000)
+    assert len(chunks) > 1
+
+    embedder = OpenAIEmbeddingService(EmbeddingSettings(api_key="sk-test"))
+    for chunk, embedded in zip(chunks, embedder._sanitize_text_for_embedding(chunks)):
+        assert "[text truncated due to length]" not in embedded
+        assert embedded.split() == chunk.split()